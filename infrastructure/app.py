@@ -3,7 +3,7 @@ import os
 
 import aws_cdk as cdk
 
-from lambda_stack.lambda_stack import LambdaStack
+from lambda_stack.lambda_stack import LambdaStack, pascal_case
 
 
 app = cdk.App()
@@ -13,11 +13,13 @@ service_name = app.node.try_get_context("service_name") or "microservice-templat
 environment = app.node.try_get_context("environment") or "dev"
 
 # Create stack with dynamic name
-stack_name = f"{service_name.title().replace('-', '')}{environment.title()}Stack"
+service_pascal_name = pascal_case(service_name)
+stack_name = f"{service_pascal_name}{environment.title()}Stack"
 
 LambdaStack(app, stack_name,
     service_name=service_name,
     env_name=environment,
+    service_pascal_name=service_pascal_name,
     # Specify the AWS Region for deployment
     env=cdk.Environment(
         account=os.getenv('CDK_DEFAULT_ACCOUNT', "cvdv"), 
@@ -1,17 +1,99 @@
 import os
 import json
+import logging
+import time
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 import boto3
 from aws_cdk import (
     Duration,
+    RemovalPolicy,
     Stack,
+    Token,
     aws_lambda as _lambda,
     aws_apigateway as apigateway,
     aws_logs as logs,
     aws_ec2 as ec2,
+    aws_events as events,
+    aws_events_targets as targets,
     CfnOutput,
 )
 from constructs import Construct
 
+logger = logging.getLogger(__name__)
+
+if os.getenv("CDK_DEBUG") == "1":
+    logging.basicConfig(level=logging.DEBUG)
+
+
+# Parsed secrets are cached on disk so repeated `cdk synth` runs skip Secrets Manager
+SECRETS_CACHE_DIR = Path.home() / ".cache" / "cdk-secrets"
+SECRETS_CACHE_TTL_SECONDS = 300
+
+
+# One boto3 session per process: service models and credentials are resolved once
+_SESSION = boto3.session.Session()
+
+
+@lru_cache(maxsize=4)
+def _cached_sm_client(region: Optional[str]):
+    return _SESSION.client('secretsmanager', region_name=region)
+
+
+def _sm_client(region: Optional[str]):
+    """Get a Secrets Manager client, cached only for permanent credentials"""
+    credentials = _SESSION.get_credentials()
+    if credentials is not None and credentials.token is None:
+        return _cached_sm_client(region)
+    # Temporary (STS / assumed-role) credentials: avoid holding a stale client
+    return _SESSION.client('secretsmanager', region_name=region)
+
+
+def _write_private_file(path: Path, content: str) -> None:
+    """Atomically write a file readable only by the current user"""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Created 0600 from the start, then renamed over the target so readers never see a partial file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=16)
+def _fetch_secret_json(secret_name: str, account: Optional[str], region: Optional[str]) -> dict:
+    """Fetch and parse a JSON secret, reusing a fresh on-disk copy when available"""
+    cache_key = hashlib.sha256(f"{secret_name}:{account}:{region}".encode()).hexdigest()
+    cache_file = SECRETS_CACHE_DIR / f"{cache_key}.json"
+
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < SECRETS_CACHE_TTL_SECONDS:
+        try:
+            return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass
+
+    response = _sm_client(region).get_secret_value(SecretId=secret_name)
+    secrets_dict = json.loads(response['SecretString'])
+
+    try:
+        _write_private_file(cache_file, json.dumps(secrets_dict))
+    except OSError:
+        pass
+
+    return secrets_dict
+
+
+@lru_cache(maxsize=None)
+def pascal_case(name: str) -> str:
+    """Convert a kebab-case name (e.g. "my-service") to PascalCase ("MyService")"""
+    return name.title().replace('-', '')
+
 
 class LambdaStack(Stack):
 
@@ -21,12 +103,14 @@ class LambdaStack(Stack):
         construct_id: str, 
         service_name: str = "microservice-template",
         env_name: str = "dev",
+        service_pascal_name: Optional[str] = None,
         **kwargs
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
         
         self.service_name = service_name
         self.env_name = env_name
+        self.service_pascal_name = service_pascal_name or pascal_case(service_name)
 
         # Get secrets from Secrets Manager at build time
         secrets_environment_vars = self._get_secrets_environment_variables()
@@ -51,24 +135,33 @@ class LambdaStack(Stack):
             allow_all_outbound=True
         )
 
+        # Switching from a Zip package to a container image forces a replacement, and
+        # CloudFormation cannot replace a function that keeps its custom name, so the
+        # image-based function is deployed under a new name (see infrastructure/README.md)
+        function_name = f"{self.service_name}-api-image-{self.env_name}"
+
+        # Log group managed directly by the stack (no LogRetention custom resource).
+        # Its name must not exist yet; the group of the old Zip function is left
+        # alone (see infrastructure/README.md)
+        api_log_group = logs.LogGroup(
+            self, "ApiLogGroup",
+            log_group_name=f"/aws/lambda/{function_name}",
+            retention=logs.RetentionDays.THREE_DAYS if self.env_name == "dev" else logs.RetentionDays.ONE_WEEK,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
         # Lambda function for the FastAPI application
-        api_lambda = _lambda.Function(
-            self, f"{self.service_name.title().replace('-', '')}ApiFunction",
-            function_name=f"{self.service_name}-api-{self.env_name}",
-            runtime=_lambda.Runtime.PYTHON_3_13,
-            handler="src.lambda_handler.handler",
-            code=_lambda.Code.from_asset(
+        # Container image: dependencies and application code live in separate
+        # layers (see Dockerfile.lambda) so unchanged layers are reused across deploys
+        api_lambda = _lambda.DockerImageFunction(
+            self, f"{self.service_pascal_name}ApiFunction",
+            function_name=function_name,
+            code=_lambda.DockerImageCode.from_image_asset(
                 "..",
-                bundling={
-                    "image": _lambda.Runtime.PYTHON_3_13.bundling_image,
-                    "command": [
-                        "bash", "-c",
-                        "pip install -r src/requirements.txt -t /asset-output && cp -au src/ /asset-output/"
-                    ],
-                }
+                file="Dockerfile.lambda",
             ),
             timeout=Duration.seconds(30),
-            memory_size=512 if self.env_name == "dev" else 1024,
+            memory_size=self._get_memory_size(),
             environment={
                 "ENVIRONMENT": self.env_name,
                 "SERVICE_NAME": self.service_name,
@@ -81,9 +174,35 @@ class LambdaStack(Stack):
             ),
             security_groups=[lambda_security_group],
             allow_public_subnet=True,
-            log_retention=logs.RetentionDays.THREE_DAYS if self.env_name == "dev" else logs.RetentionDays.ONE_WEEK,
+            log_group=api_log_group,
+            current_version_options=_lambda.VersionOptions(
+                removal_policy=RemovalPolicy.RETAIN,
+            ),
         )
 
+        # Publish a version behind a "live" alias so API Gateway always routes to
+        # pre-initialized environments: provisioned concurrency outside dev, and a
+        # much cheaper scheduled warmer for the low-traffic dev stack
+        api_alias = _lambda.Alias(
+            self, "LiveAlias",
+            alias_name="live",
+            version=api_lambda.current_version,
+            provisioned_concurrent_executions=None if self.env_name == "dev" else 5,
+        )
+
+        if self.env_name == "dev":
+            events.Rule(
+                self, "WarmerRule",
+                description=f"Keeps one {self.service_name} Lambda environment warm",
+                schedule=events.Schedule.rate(Duration.minutes(5)),
+                targets=[
+                    targets.LambdaFunction(
+                        api_alias,
+                        event=events.RuleTargetInput.from_object({"warmer": True}),
+                    )
+                ],
+            )
+
         # Allow Lambda to access the database
         db_security_group.add_ingress_rule(
             peer=lambda_security_group,
@@ -93,10 +212,13 @@ class LambdaStack(Stack):
 
         # API Gateway for the Lambda function
         api = apigateway.LambdaRestApi(
-            self, f"{self.service_name.title().replace('-', '')}ApiGateway",
-            handler=api_lambda,
+            self, f"{self.service_pascal_name}ApiGateway",
+            handler=api_alias,
             proxy=True,
             description=f"{self.service_name} API - {self.env_name}",
+            endpoint_configuration=apigateway.EndpointConfiguration(
+                types=[apigateway.EndpointType.REGIONAL]
+            ),
             deploy_options={
                 "stage_name": self.env_name,
                 "throttling_rate_limit": 100 if self.env_name == "dev" else 1000,
@@ -117,6 +239,12 @@ class LambdaStack(Stack):
             description="Lambda Function ARN"
         )
 
+        CfnOutput(
+            self, "LambdaAliasArn",
+            value=api_alias.function_arn,
+            description="Lambda Alias ARN (provisioned concurrency)"
+        )
+
         CfnOutput(
             self, "VpcId",
             value=vpc.vpc_id,
@@ -129,6 +257,17 @@ class LambdaStack(Stack):
             description="PostgreSQL Database Endpoint"
         )
 
+    def _get_memory_size(self) -> int:
+        """
+        Lambda memory in MB. Override with `-c memory_mb=<value>` (e.g. the optimum
+        found by AWS Lambda Power Tuning); 1769 MB is the smallest size that gets a
+        full vCPU, which shortens INIT for import-heavy Python apps.
+        """
+        memory_mb = self.node.try_get_context("memory_mb")
+        if memory_mb:
+            return int(memory_mb)
+        return 1769 if self.env_name == "dev" else 2048
+
     def _get_secrets_environment_variables(self) -> dict:
         """
         Get secrets from Secrets Manager at build time and return them as environment variables.
@@ -136,27 +275,21 @@ class LambdaStack(Stack):
         """
         secret_name = f"cvdv-secrets-{self.env_name}"
         
+        account = None if Token.is_unresolved(self.account) else self.account
+        region = None if Token.is_unresolved(self.region) else self.region
+        
         try:
-            # Create Secrets Manager client
-            secrets_client = boto3.client('secretsmanager')
-            
-            # Get the secret value
-            response = secrets_client.get_secret_value(SecretId=secret_name)
-            secret_string = response['SecretString']
-            
-            # Parse the JSON secret
-            secrets_dict = json.loads(secret_string)
+            secrets_dict = _fetch_secret_json(secret_name, account, region)
+            logger.debug(f"Loaded {len(secrets_dict)} environment variables from {secret_name}")
             
-            # Return the secrets exactly as they are in the JSON
-            # No modifications to keys or values
-            env_vars = {}
-            for key, value in secrets_dict.items():
-                env_vars[key] = value  # Keep original key and value
-                print(f"Setting environment variable: {key}")
-            
-            return env_vars
+            # Keys are kept as-is; CloudFormation only accepts string env values,
+            # so non-string values (numbers, booleans, objects) are JSON-encoded
+            return {
+                key: value if isinstance(value, str) else json.dumps(value)
+                for key, value in secrets_dict.items()
+            }
             
         except Exception as e:
-            print(f"Error fetching secrets from Secrets Manager: {str(e)}")
-            print(f"Secret name: {secret_name}")
+            logger.warning(f"Error fetching secrets from Secrets Manager: {str(e)}")
+            logger.debug(f"Secret name: {secret_name}")
             return {}
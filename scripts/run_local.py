@@ -10,10 +10,19 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 if __name__ == "__main__":
+    # Reload spawns a file watcher and is limited to a single worker,
+    # so only use it for day-to-day development
+    reload = os.getenv("ENVIRONMENT", "dev") == "dev"
+    
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=None if reload else os.cpu_count(),
+        # "auto" picks uvloop and httptools when installed and falls back to
+        # asyncio and h11 otherwise (uvloop is not available on Windows)
+        loop="auto",
+        http="auto",
         log_level="info"
     ) 
\ No newline at end of file
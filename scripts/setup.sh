@@ -235,7 +235,7 @@ main() {
     echo "      source .venv/bin/activate"
     echo ""
     echo "   2. For local FastAPI development:"
-    echo "      python -m uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000"
+    echo "      python -m uvicorn api.main:app --app-dir src --reload --host 0.0.0.0 --port 8000"
     echo ""
     echo "   3. For local Lambda testing with SAM:"
     echo "      ./scripts/run_sam.sh"
@@ -1,15 +1,38 @@
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass
+from functools import cache
+from typing import Dict, Optional
 
+_TRUE_VALUES = {"1", "true", "yes", "on", "y", "t"}
 
-class Settings(BaseSettings):
+
+def _read_env_file(path: str = ".env") -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a local .env file"""
+    values = {}
+    try:
+        with open(path) as env_file:
+            for line in env_file:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                values[key.strip().upper()] = value.strip().strip("'\"")
+    except OSError:
+        pass
+    return values
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     
     service_name: str = "microservice-template"
     app_name: str = "Microservice Template"
     app_version: str = "1.0.0"
     debug: bool = False
     
+    # Serve /debug/pool; explicit opt-in, independent of debug, since it is unauthenticated
+    expose_pool_status: bool = False
+    
     aws_region: str = "us-west-2"
     aws_profile: Optional[str] = None
     
@@ -22,17 +45,51 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        if self.service_name != "microservice-template":
-            self.app_name = self.service_name.replace("-", " ").title()
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables (and .env outside Lambda)"""
+        # Lambda never ships a .env file, so skip the filesystem probe there
+        env = {} if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else _read_env_file()
+        env.update((key.upper(), value) for key, value in os.environ.items())
         
-        if self.environment == "dev":
-            self.debug = True
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+        defaults = cls()
+        service_name = env.get("SERVICE_NAME", defaults.service_name)
+        environment = env.get("ENVIRONMENT", defaults.environment)
+        
+        app_name = env.get("APP_NAME", defaults.app_name)
+        if service_name != defaults.service_name:
+            app_name = service_name.replace("-", " ").title()
+        
+        debug = env["DEBUG"].lower() in _TRUE_VALUES if "DEBUG" in env else defaults.debug
+        if environment == "dev":
+            debug = True
+        
+        expose_pool_status = (
+            env["EXPOSE_POOL_STATUS"].lower() in _TRUE_VALUES
+            if "EXPOSE_POOL_STATUS" in env else defaults.expose_pool_status
+        )
+        
+        return cls(
+            service_name=service_name,
+            app_name=app_name,
+            app_version=env.get("APP_VERSION", defaults.app_version),
+            debug=debug,
+            expose_pool_status=expose_pool_status,
+            aws_region=env.get("AWS_REGION", defaults.aws_region),
+            aws_profile=env.get("AWS_PROFILE", defaults.aws_profile),
+            environment=environment,
+            database_type=env.get("DATABASE_TYPE", defaults.database_type),
+            jwt_secret_key=env.get("JWT_SECRET_KEY", defaults.jwt_secret_key),
+            jwt_algorithm=env.get("JWT_ALGORITHM", defaults.jwt_algorithm),
+            jwt_expiration_hours=int(env.get("JWT_EXPIRATION_HOURS", defaults.jwt_expiration_hours)),
+        )
+
+
+@cache
+def get_settings() -> Settings:
+    return Settings.from_env()
+
 
+__all__ = ["Settings", "get_settings", "settings"]
 
-settings = Settings() 
\ No newline at end of file
+settings = get_settings()
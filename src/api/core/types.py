@@ -0,0 +1,20 @@
+from typing import Annotated
+from pydantic import AfterValidator, StringConstraints
+
+# Shape check only (one @, no whitespace, dotted domain); pydantic-core compiles it once
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+def _normalize_email(value: str) -> str:
+    """Lowercase the domain part, as EmailStr did, so lookups by email stay consistent"""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=255, pattern=EMAIL_PATTERN),
+    AfterValidator(_normalize_email),
+]
+
+__all__ = ["EMAIL_PATTERN", "EmailAddress"]
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import orjson
 from fastapi import HTTPException, status
 
 
@@ -58,4 +59,21 @@ class InternalServerErrorException(BaseHTTPException):
 class ServiceUnavailableException(BaseHTTPException):
     
     def __init__(self, detail: str = "Service Unavailable"):
-        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail) 
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+
+
+# Pre-serialized error bodies (up to the "path" value) for every exception's
+# default detail; the middleware only appends the request path
+ERROR_BODY_PREFIXES: Dict[Tuple[int, str], bytes] = {
+    (exc.status_code, exc.detail): b'{"error":{"code":%d,"message":%b,"path":' % (exc.status_code, orjson.dumps(exc.detail))
+    for exc in (
+        BadRequestException(),
+        UnauthorizedException(),
+        ForbiddenException(),
+        NotFoundException(),
+        ConflictException(),
+        UnprocessableEntityException(),
+        InternalServerErrorException(),
+        ServiceUnavailableException(),
+    )
+}
\ No newline at end of file
@@ -1,24 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_injector import attach_injector
 
 from .core.config import settings
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
 from modules.app_module import app_module
+from modules.database import db_connection
+from modules.di_container import global_di_container
 from .middleware.error_middleware import ErrorHandlingMiddleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables once at startup instead of on every write
+    await db_connection.create_tables()
+    yield
+
+
 def create_app() -> FastAPI:
-    
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
         debug=settings.debug,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     
     app.add_middleware(ErrorHandlingMiddleware)
@@ -33,7 +41,6 @@ def create_app() -> FastAPI:
     
     app.include_router(app_module.router)
     
-    from modules.di_container import global_di_container
     attach_injector(app, global_di_container.get_injector())
     
     return app
@@ -1,96 +1,111 @@
 import logging
 import traceback
-from typing import Callable
+import orjson
+from typing import Any, Dict, List, Optional
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ..exceptions.http_exceptions import (
-    BaseHTTPException,
-    BadRequestException,
-    NotFoundException,
-    ConflictException,
-    UnauthorizedException,
-    ForbiddenException,
-    UnprocessableEntityException,
-    InternalServerErrorException
-)
+from ..exceptions.http_exceptions import BaseHTTPException, ERROR_BODY_PREFIXES
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+def _error_body(code: int, message: Any, path: str) -> Dict[str, Any]:
+    return {
+        "error": {
+            "code": code,
+            "message": message,
+            "path": path
+        }
+    }
+
+
+def _error_response(code: int, message: Any, path: str) -> Response:
+    # Default messages reuse a pre-serialized body; only the path is encoded per request
+    prefix = ERROR_BODY_PREFIXES.get((code, message)) if isinstance(message, str) else None
+    if prefix is not None:
+        return Response(
+            content=prefix + orjson.dumps(path) + b"}}",
+            status_code=code,
+            media_type="application/json"
+        )
+    
+    return JSONResponse(
+        status_code=code,
+        content=_error_body(code, message, path)
+    )
+
+
+def _http_exception_response(exc: Exception, path: str) -> Response:
+    return _error_response(exc.status_code, exc.detail, path)
+
+
+def _value_error_response(exc: Exception, path: str) -> Response:
+    return _error_response(400, str(exc), path)
+
+
+# Checked in order; the first matching exception type wins
+_EXCEPTION_HANDLERS = {
+    BaseHTTPException: _http_exception_response,
+    ValueError: _value_error_response,
+}
+
+
+class ErrorHandlingMiddleware:
+    """Pure ASGI middleware: successful responses stream through untouched,
+    only error responses (status >= 400) are buffered and rewritten."""
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        try:
-            response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        response_started = False
+        error_start: Optional[Message] = None
+        error_chunks: List[bytes] = []
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started, error_start
             
-            if response.status_code >= 400:
-                return await self.convert_error_response(request, response)
+            if message["type"] == "http.response.start":
+                response_started = True
+                if message["status"] >= 400:
+                    error_start = message
+                    return
+            elif message["type"] == "http.response.body" and error_start is not None:
+                error_chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response = await self.convert_error_response(request, error_start, b"".join(error_chunks))
+                    await response(scope, receive, send)
+                return
             
-            return response
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            return await self.handle_exception(request, exc)
+            if response_started:
+                raise
+            response = await self.handle_exception(request, exc)
+            await response(scope, receive, send)
     
-    async def handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
+    async def handle_exception(self, request: Request, exc: Exception) -> Response:
+        path = str(request.url.path)
         
-        if isinstance(exc, BaseHTTPException):
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    "error": {
-                        "code": exc.status_code,
-                        "message": exc.detail,
-                        "path": str(request.url.path)
-                    }
-                }
-            )
+        for exc_type, build_response in _EXCEPTION_HANDLERS.items():
+            if isinstance(exc, exc_type):
+                return build_response(exc, path)
         
-        elif hasattr(exc, 'status_code') and hasattr(exc, 'detail'):
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    "error": {
-                        "code": exc.status_code,
-                        "message": exc.detail,
-                        "path": str(request.url.path)
-                    }
-                }
-            )
+        # Other HTTP-like exceptions (e.g. Starlette's HTTPException)
+        if hasattr(exc, 'status_code') and hasattr(exc, 'detail'):
+            return _http_exception_response(exc, path)
         
-        elif isinstance(exc, (BadRequestException, NotFoundException, ConflictException, 
-                             UnauthorizedException, ForbiddenException, UnprocessableEntityException)):
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    "error": {
-                        "code": exc.status_code,
-                        "message": exc.detail,
-                        "path": str(request.url.path)
-                    }
-                }
-            )
-        
-        elif isinstance(exc, ValueError):
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": {
-                        "code": 400,
-                        "message": str(exc),
-                        "path": str(request.url.path)
-                    }
-                }
-            )
-        
-        else:
-            return await self.handle_unexpected_exception(request, exc)
-    
-
+        return await self.handle_unexpected_exception(request, exc)
     
     async def handle_unexpected_exception(self, request: Request, exc: Exception) -> JSONResponse:
         
@@ -107,13 +122,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         
         is_development = getattr(request.app.state, 'debug', False) if hasattr(request.app, 'state') else False
         
-        error_response = {
-            "error": {
-                "code": 500,
-                "message": "Internal Server Error",
-                "path": str(request.url.path)
-            }
-        }
+        error_response = _error_body(500, "Internal Server Error", str(request.url.path))
         
         if is_development:
             error_response["error"]["traceback"] = traceback.format_exc()
@@ -125,34 +134,21 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             content=error_response
         )
     
-    async def convert_error_response(self, request: Request, response: Response) -> JSONResponse:
+    async def convert_error_response(self, request: Request, start_message: Message, body: bytes) -> Response:
         
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
+        status_code = start_message["status"]
+        headers = start_message.get("headers", [])
+        content_type = next((value for key, value in headers if key.lower() == b"content-type"), b"")
+        
+        # Non-JSON error bodies are passed through untouched
+        if not content_type.startswith(b"application/json"):
+            response = Response(content=body, status_code=status_code)
+            response.raw_headers = list(headers)
+            return response
         
         try:
-            import json
-            error_data = json.loads(response_body.decode())
-            
-            return JSONResponse(
-                status_code=response.status_code,
-                content={
-                    "error": {
-                        "code": response.status_code,
-                        "message": error_data.get("detail", "Unknown error"),
-                        "path": str(request.url.path)
-                    }
-                }
-            )
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return JSONResponse(
-                status_code=response.status_code,
-                content={
-                    "error": {
-                        "code": response.status_code,
-                        "message": "Unknown error",
-                        "path": str(request.url.path)
-                    }
-                }
-            ) 
\ No newline at end of file
+            message = orjson.loads(body).get("detail", "Unknown error")
+        except (orjson.JSONDecodeError, AttributeError):
+            message = "Unknown error"
+        
+        return _error_response(status_code, message, str(request.url.path))
\ No newline at end of file
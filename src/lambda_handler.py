@@ -1,4 +1,42 @@
+import os
+
 from mangum import Mangum
-from src.api.main import app
+from api.main import app
+
+# Skip the startup/shutdown round-trips; tables are created lazily on the first write
+_mangum = Mangum(
+    app,
+    lifespan="off",
+    api_gateway_base_path="/",
+    text_mime_types=["application/json", "text/plain", "text/html"],
+)
+
+
+def handler(event, context):
+    # Scheduled warmer pings only keep the environment alive
+    if event.get("warmer"):
+        return {"warmed": True}
+    return _mangum(event, context)
+
+
+def _prime() -> None:
+    """Send a synthetic health request through the handler during INIT"""
+    event = {
+        "resource": "/{proxy+}",
+        "path": "/api/v1/health",
+        "httpMethod": "GET",
+        "headers": {},
+        "multiValueHeaders": {},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "requestContext": {},
+        "body": None,
+        "isBase64Encoded": False,
+    }
+    handler(event, {})
+
 
-handler = Mangum(app) 
\ No newline at end of file
+# Provisioned instances are initialized ahead of traffic, so warm up routers,
+# DI graph and pydantic validators before the first real request arrives
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    _prime()
@@ -30,7 +30,7 @@ class AuthenticationModule:
     def _register_routes(self):
         from ..di_container import global_di_container
 
-        auth_controller = global_di_container.get_injector().get(AuthenticationController)
+        auth_controller = global_di_container.resolve(AuthenticationController)
         self.router.include_router(auth_controller.router)
 
 
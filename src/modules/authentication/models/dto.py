@@ -1,14 +1,16 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from typing import Optional
 
+from api.core.types import EmailAddress
+
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     password: str
 
 
 class SignupRequest(BaseModel):
-    email: EmailStr
+    email: EmailAddress
 
 
 class LoginResponse(BaseModel):
@@ -10,7 +10,6 @@ from api.exceptions.http_exceptions import (
     ConflictException,
     NotFoundException
 )
-import uuid
 
 
 class AuthenticationServiceImpl(AuthenticationService):
@@ -20,28 +19,35 @@ class AuthenticationServiceImpl(AuthenticationService):
         self._user_service = user_service
         self._password_service = password_service
         self._jwt_service = jwt_service
+        # Verified when there is no real hash, so every login pays the same cost
+        self._dummy_password_hash = password_service.dummy_hash
     
     async def login(self, request: LoginRequest) -> LoginResponse:
         """Authenticate user with email and password"""
         # Get user by email
         user = await self._user_service.get_user_by_email(request.email)
         
-        if not user:
+        # Always verify a password, even for unknown users or users without one,
+        # so response time does not reveal which emails are registered
+        has_password = user is not None and bool(user.password_hash)
+        password_hash = user.password_hash if has_password else self._dummy_password_hash
+        password_valid = await self._password_service.verify_password(request.password, password_hash)
+        
+        if not has_password or not password_valid:
             raise UnauthorizedException("Invalid email or password")
         
-        # Check if user has a password hash
-        if not user.password_hash:
-            raise UnauthorizedException("User has no password set")
+        user_id = str(user.id)
         
-        # Verify password
-        if not self._password_service.verify_password(request.password, user.password_hash):
-            raise UnauthorizedException("Invalid email or password")
+        # Upgrade legacy bcrypt or under-cost argon2 hashes while the plain password is at hand
+        if self._password_service.needs_rehash(password_hash):
+            new_hash = await self._password_service.hash_password(request.password)
+            await self._user_service.update_password_hash(user_id, new_hash)
         
         # Generate JWT token
-        token = self._jwt_service.create_user_token(str(user.id), user.email)
+        token = self._jwt_service.create_user_token(user_id, user.email)
         
         return LoginResponse(
-            user_id=str(user.id),
+            user_id=user_id,
             token=token
         )
     
@@ -69,11 +75,12 @@ class AuthenticationServiceImpl(AuthenticationService):
         )
         
         user = await self._user_service.create_user(create_user_request)
+        user_id = str(user.id)
         
         # Generate JWT token
-        token = self._jwt_service.create_user_token(str(user.id), user.email)
+        token = self._jwt_service.create_user_token(user_id, user.email)
         
         return SignupResponse(
-            user_id=str(user.id),
+            user_id=user_id,
             token=token
         )
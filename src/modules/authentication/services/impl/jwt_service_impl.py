@@ -1,17 +1,36 @@
 import jwt
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple
 from injector import inject
 from api.core.config import settings
 from ..jwt_service import JWTService
 
+DEFAULT_TOKEN_EXPIRATION = timedelta(minutes=30)
+USER_TOKEN_EXPIRATION = timedelta(hours=24)
+
 
 class JWTServiceImpl(JWTService):
     """Service for JWT token generation and validation"""
     
+    # Verified claims are cached by token digest, bounded in size and lifetime
+    VERIFY_CACHE_MAX_SIZE = 1024
+    VERIFY_CACHE_MAX_TTL_SECONDS = 300
+    
     @inject
     def __init__(self):
-        pass
+        # Reused codec instead of the module-level jwt.encode/jwt.decode wrappers
+        self._jwt = jwt.PyJWT()
+        # Resolved once; settings are immutable for the life of the process
+        # Pre-encoded so PyJWT's HMAC key preparation has no str->bytes work per call
+        self._secret_key = getattr(settings, 'jwt_secret_key', 'your-secret-key-change-in-production').encode()
+        self._algorithm = getattr(settings, 'jwt_algorithm', 'HS256')
+        self._algorithms = [self._algorithm]
+        self._default_expiration_seconds = DEFAULT_TOKEN_EXPIRATION.total_seconds()
+        self._user_expiration_seconds = USER_TOKEN_EXPIRATION.total_seconds()
+        self._verify_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
     
     def create_access_token(
         self, 
@@ -21,37 +40,51 @@ class JWTServiceImpl(JWTService):
         """Create a JWT access token"""
         to_encode = data.copy()
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            # Default to 30 minutes
-            expire = datetime.utcnow() + timedelta(minutes=30)
-        
-        to_encode.update({"exp": expire})
+        # Numeric exp (seconds since epoch) avoids datetime allocation and conversion
+        expiration_seconds = expires_delta.total_seconds() if expires_delta else self._default_expiration_seconds
+        to_encode["exp"] = int(time.time() + expiration_seconds)
         
-        # Use a secret key from settings or environment
-        secret_key = getattr(settings, 'jwt_secret_key', 'your-secret-key-change-in-production')
-        algorithm = getattr(settings, 'jwt_algorithm', 'HS256')
-        
-        encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
+    
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """Sign a payload as-is (no defensive copy)"""
+        return self._jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode a JWT token"""
+        # Only the digest is kept as key, never the token itself
+        cache_key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            expires_at, payload = cached
+            if now < expires_at:
+                self._verify_cache.move_to_end(cache_key)
+                return dict(payload)
+            del self._verify_cache[cache_key]
+        
         try:
-            secret_key = getattr(settings, 'jwt_secret_key', 'your-secret-key-change-in-production')
-            algorithm = getattr(settings, 'jwt_algorithm', 'HS256')
-            
-            payload = jwt.decode(token, secret_key, algorithms=[algorithm])
-            return payload
-        except jwt.ExpiredSignatureError:
-            return None
-        except jwt.JWTError:
+            payload = self._jwt.decode(token, self._secret_key, algorithms=self._algorithms)
+        except jwt.InvalidTokenError:
+            # Failures are never cached
             return None
+        
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(exp, now + self.VERIFY_CACHE_MAX_TTL_SECONDS)
+            if expires_at > now:
+                self._verify_cache[cache_key] = (expires_at, dict(payload))
+                if len(self._verify_cache) > self.VERIFY_CACHE_MAX_SIZE:
+                    self._verify_cache.popitem(last=False)
+        
+        return payload
     
     def create_user_token(self, user_id: str, email: str) -> str:
         """Create a JWT token for a user"""
-        return self.create_access_token(
-            data={"sub": user_id, "email": email},
-            expires_delta=timedelta(hours=24)  # 24 hours expiration
-        )
+        # Payload is built here, so it can be signed without copying
+        return self._encode({
+            "sub": user_id,
+            "email": email,
+            "exp": int(time.time() + self._user_expiration_seconds),
+        })
@@ -1,9 +1,18 @@
 import os
+import logging
 from typing import Optional
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import NullPool
 
+logger = logging.getLogger(__name__)
+
+# Connectivity probe, built once and reused for every health check
+HEALTH_CHECK_STATEMENT = text("SELECT 1")
+
+DEFAULT_POOL_SIZE = min(32, (os.cpu_count() or 1) * 2 + 4)
+
 
 class PostgreSQLConnection:
     """Singleton PostgreSQL connection manager using SQLAlchemy"""
@@ -21,16 +30,58 @@ class PostgreSQLConnection:
         if not hasattr(self, '_initialized'):
             self._initialized = True
             self._connected = False
+            self._database_url: Optional[str] = None
+            self._tables_created = False
     
     def _build_database_url(self) -> str:
-        """Build PostgreSQL connection URL from environment variables"""
+        """Build PostgreSQL connection URL from environment variables (cached after first build)"""
+        if self._database_url is not None:
+            return self._database_url
+        
         host = os.getenv('POSTGRES_HOST', 'localhost')
         port = os.getenv('POSTGRES_PORT', '5432')
         database = os.getenv('POSTGRES_DATABASE', 'postgres')
         username = os.getenv('POSTGRES_USERNAME', 'postgres')
         password = os.getenv('POSTGRES_PASSWORD', 'postgres')
         
-        return f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
+        self._database_url = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
+        return self._database_url
+    
+    def _create_engine(self) -> None:
+        """Build the engine and session factory; no connection is opened until first use"""
+        database_url = self._build_database_url()
+        
+        engine_options = {
+            'echo': os.getenv('SQLALCHEMY_ECHO', 'false').lower() == 'true',
+            'pool_pre_ping': True,
+            # asyncpg prepares each statement once per connection and reuses it
+            'connect_args': {
+                'statement_cache_size': int(os.getenv('POSTGRES_STATEMENT_CACHE_SIZE', '1024')),
+                'prepared_statement_cache_size': int(os.getenv('POSTGRES_STATEMENT_CACHE_SIZE', '1024')),
+            },
+        }
+        
+        if os.getenv('POSTGRES_USE_NULL_POOL', 'false').lower() == 'true':
+            # Test-only: every session opens (and closes) its own connection
+            logger.warning("POSTGRES_USE_NULL_POOL is enabled: connections are not pooled")
+            engine_options['poolclass'] = NullPool
+        else:
+            engine_options.update(
+                pool_size=int(os.getenv('POSTGRES_MAX_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+                max_overflow=int(os.getenv('POSTGRES_MAX_OVERFLOW', '20')),
+                pool_recycle=int(os.getenv('POSTGRES_POOL_RECYCLE', '1800')),
+                pool_timeout=int(os.getenv('POSTGRES_POOL_TIMEOUT', '30')),
+            )
+        
+        self._engine = create_async_engine(database_url, **engine_options)
+        
+        self._session_factory = async_sessionmaker(
+            bind=self._engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+        
+        self._connected = True
     
     async def connect(self) -> None:
         """Initialize SQLAlchemy engine and session factory"""
@@ -38,24 +89,7 @@ class PostgreSQLConnection:
             return
         
         try:
-            database_url = self._build_database_url()
-            
-            self._engine = create_async_engine(
-                database_url,
-                echo=os.getenv('SQLALCHEMY_ECHO', 'false').lower() == 'true',
-                pool_size=int(os.getenv('POSTGRES_MAX_POOL_SIZE', '10')),
-                max_overflow=int(os.getenv('POSTGRES_MAX_OVERFLOW', '20')),
-                pool_pre_ping=True,
-                poolclass=NullPool if os.getenv('POSTGRES_USE_NULL_POOL', 'false').lower() == 'true' else None
-            )
-            
-            self._session_factory = async_sessionmaker(
-                bind=self._engine,
-                class_=AsyncSession,
-                expire_on_commit=False
-            )
-            
-            self._connected = True
+            self._create_engine()
         except Exception as e:
             print(f"Failed to connect to PostgreSQL: {e}")
             self._connected = False
@@ -75,10 +109,16 @@ class PostgreSQLConnection:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._engine
     
+    def get_engine_or_create(self):
+        """Get SQLAlchemy engine, creating it on first use"""
+        if not self._engine:
+            self._create_engine()
+        return self._engine
+    
     def get_session_factory(self):
-        """Get SQLAlchemy session factory"""
+        """Get SQLAlchemy session factory, creating the pooled engine on first use"""
         if not self._session_factory:
-            raise RuntimeError("Database not connected. Call connect() first.")
+            self._create_engine()
         return self._session_factory
     
     def get_session(self) -> AsyncSession:
@@ -90,14 +130,33 @@ class PostgreSQLConnection:
         """Check if database is connected"""
         return self._connected and self._engine is not None
     
+    def pool_status(self) -> str:
+        """Describe the connection pool (size, checked in/out, overflow) for debugging"""
+        if not self._engine:
+            return "Database not connected"
+        return self._engine.pool.status()
+    
+    async def create_tables(self) -> None:
+        """Create all mapped tables once per process"""
+        if self._tables_created:
+            return
+        
+        try:
+            async with self.get_engine_or_create().begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            self._tables_created = True
+        except Exception as e:
+            print(f"Warning: Could not ensure tables exist: {e}")
+    
     async def health_check(self) -> bool:
         """Check database connectivity"""
         try:
             if not self.is_connected():
                 return False
             
-            async with self.get_session() as session:
-                await session.execute("SELECT 1")
+            # Pooled connection only: no ORM session or identity map needed
+            async with self.get_engine().connect() as conn:
+                await conn.execute(HEALTH_CHECK_STATEMENT)
                 return True
         except Exception as e:
             print(f"PostgreSQL health check failed: {e}")
@@ -1,20 +1,79 @@
 from abc import ABCMeta
-from typing import Dict, Any, TypeVar
-from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Any, FrozenSet, Tuple, TypeVar
+from operator import attrgetter
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index, text
+from sqlalchemy.orm import declared_attr
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
+from sqlalchemy.sql.sqltypes import NullType
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .connections.postgresql_connection import Base, db_connection
 
 T = TypeVar('T', bound='BaseModel')
 
+_UTC = timezone.utc
+
+# Timestamp columns that from_dict parses from ISO 8601 strings
+_DATETIME_COLUMNS = frozenset(('created_at', 'updated_at', 'deleted_at'))
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a column value of unknown type to a JSON-friendly value"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _build_to_dict(column_names: Tuple[str, ...], columns) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a to_dict specialized to the column types of one table"""
+    fields = []
+    for name, column in zip(column_names, columns):
+        attr = f"self.{name}" if name.isidentifier() else f"getattr(self, {name!r})"
+        if isinstance(column.type, DateTime):
+            expr = f"None if (v := {attr}) is None else v.isoformat()"
+        elif isinstance(column.type, UUID):
+            expr = f"None if (v := {attr}) is None else str(v)"
+        elif isinstance(column.type, NullType):
+            # Untyped columns keep the runtime type checks
+            expr = f"_serialize_value({attr})"
+        else:
+            expr = attr
+        fields.append(f"        {name!r}: {expr},")
+    
+    source = "def to_dict(self):\n    return {\n" + "\n".join(fields) + "\n    }\n"
+    namespace = {'_serialize_value': _serialize_value}
+    exec(source, namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__doc__ = "Convert model to dictionary"
+    return to_dict
+
 
 # Custom metaclass that combines SQLAlchemy's DeclarativeMeta with ABCMeta
 class BaseModelMeta(type(Base), ABCMeta):
-    pass
+    
+    def __init__(cls, classname, bases, dict_, **kw):
+        super().__init__(classname, bases, dict_, **kw)
+        
+        # Column metadata is fixed once the table is mapped, so compute it once per class
+        table = cls.__dict__.get('__table__')
+        if table is not None:
+            cls._column_names = tuple(column.name for column in table.columns)
+            cls._column_name_set = frozenset(cls._column_names)
+            cls._updatable_columns = tuple(
+                name for name in cls._column_names if name not in ('id', 'created_at')
+            )
+            cls._get_column_values = attrgetter(*cls._column_names)
+            
+            # Subclasses that define their own to_dict keep it
+            if 'to_dict' not in dict_:
+                cls.to_dict = _build_to_dict(cls._column_names, table.columns)
 
 
 class BaseModel(Base, metaclass=BaseModelMeta):
@@ -26,39 +85,51 @@ class BaseModel(Base, metaclass=BaseModelMeta):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    
+    @declared_attr.directive
+    def __table_args__(cls) -> Tuple[Index, ...]:
+        """Partial indexes backing the live (find_all/find_by) and deleted (find_deleted) listings"""
+        return (
+            Index(
+                f'ix_{cls.__tablename__}_live_created_at',
+                'created_at',
+                postgresql_where=text('deleted_at IS NULL'),
+            ),
+            Index(
+                f'ix_{cls.__tablename__}_deleted_deleted_at',
+                'deleted_at',
+                postgresql_where=text('deleted_at IS NOT NULL'),
+            ),
+        )
+    
+    # Populated per mapped subclass by BaseModelMeta
+    _column_names: Tuple[str, ...] = ()
+    _column_name_set: FrozenSet[str] = frozenset()
+    _updatable_columns: Tuple[str, ...] = ()
+    _get_column_values: Callable[[Any], Tuple[Any, ...]]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert model to dictionary"""
-        result = {}
-        
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            
-            # Handle different data types
-            if isinstance(value, datetime):
-                result[column.name] = value.isoformat()
-            elif isinstance(value, uuid.UUID):
-                result[column.name] = str(value)
-            else:
-                result[column.name] = value
-        
-        return result
+        """Convert model to dictionary (mapped subclasses get a generated version)"""
+        return {
+            name: _serialize_value(value)
+            for name, value in zip(self._column_names, self._get_column_values(self))
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseModel':
         """Create model instance from dictionary"""
         # Filter only the columns that exist in the model
-        valid_columns = {column.name for column in cls.__table__.columns}
+        valid_columns = cls._column_name_set
         filtered_data = {k: v for k, v in data.items() if k in valid_columns}
         
         # Parse datetime strings if needed
-        for key, value in filtered_data.items():
-            if isinstance(value, str) and key in ['created_at', 'updated_at']:
+        for key in _DATETIME_COLUMNS.intersection(filtered_data):
+            value = filtered_data[key]
+            if isinstance(value, str):
                 try:
-                    from dateutil.parser import parse
-                    filtered_data[key] = parse(value)
-                except (ValueError, ImportError):
+                    filtered_data[key] = datetime.fromisoformat(value)
+                except ValueError:
                     pass
         
         return cls(**filtered_data)
@@ -73,7 +144,7 @@ class BaseModel(Base, metaclass=BaseModelMeta):
     
     def soft_delete(self) -> None:
         """Soft delete this entity by setting deleted_at timestamp"""
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(_UTC)
     
     def restore(self) -> None:
         """Restore a soft deleted entity by clearing deleted_at"""
@@ -97,39 +168,33 @@ class BaseModel(Base, metaclass=BaseModelMeta):
     # Active Record Pattern - Instance Methods Only
     
     @classmethod
-    async def _get_session(cls) -> AsyncSession:
-        """Get database session"""
-        if not db_connection.is_connected():
-            await db_connection.connect()
-        return db_connection.get_session()
+    @asynccontextmanager
+    async def _get_session(cls) -> AsyncIterator[AsyncSession]:
+        """Get database session with automatic cleanup"""
+        async with db_connection.get_session() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
     
     @classmethod
     async def _ensure_tables_exist(cls) -> None:
-        """Ensure tables exist"""
-        try:
-            if not db_connection.is_connected():
-                await db_connection.connect()
-            
-            engine = db_connection.get_engine()
-            async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-        except Exception as e:
-            print(f"Warning: Could not ensure tables exist: {e}")
+        """Ensure tables exist (only the first call per process hits the database)"""
+        await db_connection.create_tables()
     
     async def save(self: T) -> T:
         """Save this entity to database (Active Record pattern)"""
         await self._ensure_tables_exist()
         
-        session = await self._get_session()
-        try:
+        async with self._get_session() as session:
             # Check if entity exists
             if self.id:
                 existing = await session.get(self.__class__, self.id)
                 if existing:
                     # Update existing
-                    for column in self.__class__.__table__.columns:
-                        if column.name not in ['id', 'created_at']:
-                            setattr(existing, column.name, getattr(self, column.name))
+                    for name in self._updatable_columns:
+                        setattr(existing, name, getattr(self, name))
                     await session.commit()
                     await session.refresh(existing)
                     return existing
@@ -139,11 +204,6 @@ class BaseModel(Base, metaclass=BaseModelMeta):
             await session.commit()
             await session.refresh(self)
             return self
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
     
     async def delete(self, hard_delete: bool = False) -> bool:
         """Delete this entity from database (Active Record pattern)
@@ -151,8 +211,7 @@ class BaseModel(Base, metaclass=BaseModelMeta):
         Args:
             hard_delete: If True, permanently delete from database. If False, soft delete.
         """
-        session = await self._get_session()
-        try:
+        async with self._get_session() as session:
             if hard_delete:
                 # Hard delete - remove from database
                 await session.delete(self)
@@ -163,20 +222,12 @@ class BaseModel(Base, metaclass=BaseModelMeta):
             
             await session.commit()
             return True
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
     
     async def refresh(self: T) -> T:
         """Refresh this entity from database (Active Record pattern)"""
-        session = await self._get_session()
-        try:
+        async with self._get_session() as session:
             await session.refresh(self)
             return self
-        finally:
-            await session.close()
 
 
 # Alias for backward compatibility
@@ -1,14 +1,34 @@
-from typing import Generic, TypeVar, List, Optional, Any, Dict, Type
+from typing import Generic, TypeVar, List, Optional, Any, Dict, Type, Iterable, FrozenSet, Sequence, Tuple, Union
 from abc import ABC
-from sqlalchemy import select, update, delete, func
+from functools import lru_cache
+from itertools import islice
+from sqlalchemy import select, update, delete, func, literal_column, bindparam
+from sqlalchemy.engine import Result
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 
 from .model import BaseModel
-from .connections.postgresql_connection import db_connection, Base
+from .connections.postgresql_connection import db_connection
 
 T = TypeVar('T', bound=BaseModel)
 
+# Rows per INSERT statement for bulk writes
+DEFAULT_BATCH_SIZE = 1000
+
+# Bound parameter names for filter values, kept apart from UPDATE ... SET parameters
+FILTER_PARAM_PREFIX = 'filter_'
+
+
+@lru_cache(maxsize=256)
+def _build_filter_criteria(model_class: type, keys: FrozenSet[str], null_keys: FrozenSet[str]) -> Tuple[ColumnElement, ...]:
+    """Build (and cache) the WHERE criteria for one model and set of filter keys"""
+    criteria = [getattr(model_class, key) == bindparam(FILTER_PARAM_PREFIX + key) for key in sorted(keys)]
+    criteria.extend(getattr(model_class, key).is_(None) for key in sorted(null_keys))
+    return tuple(criteria)
+
 
 class BaseRepository(Generic[T], ABC):
     """Base SQLAlchemy repository class similar to JPA Repository pattern"""
@@ -18,31 +38,51 @@ class BaseRepository(Generic[T], ABC):
         self.connection = db_connection
     
     async def _ensure_tables_exist(self) -> None:
-        """Create tables if they don't exist"""
-        try:
-            if not self.connection.is_connected():
-                await self.connection.connect()
-            
-            engine = self.connection.get_engine()
-            async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-        except Exception as e:
-            print(f"Warning: Could not ensure tables exist: {e}")
+        """Create tables if they don't exist (only the first call per process hits the database)"""
+        await self.connection.create_tables()
+    
+    def _filter_criteria(self, filters: Dict[str, Any]) -> Tuple[Tuple[ColumnElement, ...], Dict[str, Any]]:
+        """WHERE criteria and bound parameters for equality filters on known columns"""
+        keys = self.model_class._column_name_set.intersection(filters)
+        params = {}
+        null_keys = set()
+        for key in keys:
+            value = filters[key]
+            if value is None:
+                null_keys.add(key)
+            else:
+                params[FILTER_PARAM_PREFIX + key] = value
+        
+        criteria = _build_filter_criteria(self.model_class, frozenset(keys - null_keys), frozenset(null_keys))
+        return criteria, params
+    
+    def _select(self, fields: Optional[Tuple[str, ...]] = None) -> Select:
+        """SELECT of whole entities, or of just the named columns"""
+        if fields is None:
+            return select(self.model_class)
+        
+        unknown = set(fields).difference(self.model_class._column_name_set)
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.model_class.__name__}: {', '.join(sorted(unknown))}")
+        return select(*(self.model_class.__table__.c[name] for name in fields))
+    
+    @staticmethod
+    def _rows(result: Result, fields: Optional[Tuple[str, ...]] = None) -> Union[List[T], List[Dict[str, Any]]]:
+        """Entities from a whole-entity SELECT, plain dicts from a projection"""
+        if fields is None:
+            return list(result.scalars().all())
+        return [dict(row) for row in result.mappings()]
     
     @asynccontextmanager
     async def _get_session(self):
         """Get database session with automatic cleanup"""
-        if not self.connection.is_connected():
-            await self.connection.connect()
-        
-        session = self.connection.get_session()
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        # Closing the session returns its connection to the engine's pool
+        async with self.connection.get_session() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
     
     # JPA-style methods
     
@@ -56,9 +96,8 @@ class BaseRepository(Generic[T], ABC):
                 existing = await session.get(self.model_class, entity.id)
                 if existing:
                     # Update existing
-                    for column in self.model_class.__table__.columns:
-                        if column.name not in ['id', 'created_at']:
-                            setattr(existing, column.name, getattr(entity, column.name))
+                    for name in self.model_class._updatable_columns:
+                        setattr(existing, name, getattr(entity, name))
                     await session.commit()
                     await session.refresh(existing)
                     return existing
@@ -69,19 +108,23 @@ class BaseRepository(Generic[T], ABC):
             await session.refresh(entity)
             return entity
     
-    async def save_all(self, entities: List[T]) -> List[T]:
+    async def save_all(self, entities: Iterable[T], batch_size: int = DEFAULT_BATCH_SIZE) -> List[T]:
         """Save multiple entities"""
         await self._ensure_tables_exist()
         
+        pending = iter(entities)
+        saved: List[T] = []
+        
         async with self._get_session() as session:
-            session.add_all(entities)
+            # Each flush is a single batched INSERT; server defaults come back via
+            # RETURNING (eager_defaults="auto"), so no per-entity refresh is needed
+            while batch := list(islice(pending, batch_size)):
+                session.add_all(batch)
+                await session.flush()
+                saved.extend(batch)
             await session.commit()
-            
-            # Refresh all entities
-            for entity in entities:
-                await session.refresh(entity)
-            
-            return entities
+        
+        return saved
     
     async def find_by_id(self, entity_id: Any, include_deleted: bool = False) -> Optional[T]:
         """Find entity by ID"""
@@ -95,10 +138,18 @@ class BaseRepository(Generic[T], ABC):
             result = await session.execute(stmt)
             return result.scalar_one_or_none()
     
-    async def find_all(self, limit: int = 100, offset: int = 0, include_deleted: bool = False) -> List[T]:
-        """Find all entities with pagination"""
+    async def find_all(self, limit: int = 100, offset: int = 0, include_deleted: bool = False,
+                       fields: Optional[Tuple[str, ...]] = None,
+                       options: Optional[Sequence[ExecutableOption]] = None) -> Union[List[T], List[Dict[str, Any]]]:
+        """Find all entities with pagination (as dicts of only `fields` when given)
+        
+        List callers loading relationships must pass eager-loading `options`
+        (e.g. selectinload) so related rows are not lazy loaded one entity at a time.
+        """
         async with self._get_session() as session:
-            stmt = select(self.model_class)
+            stmt = self._select(fields)
+            if options:
+                stmt = stmt.options(*options)
             
             # Filter out soft deleted entities unless explicitly requested
             if not include_deleted:
@@ -106,26 +157,22 @@ class BaseRepository(Generic[T], ABC):
             
             stmt = stmt.order_by(self.model_class.created_at.desc()).limit(limit).offset(offset)
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return self._rows(result, fields)
     
-    async def find_by(self, include_deleted: bool = False, **filters) -> List[T]:
-        """Find entities by filters"""
+    async def find_by(self, include_deleted: bool = False, fields: Optional[Tuple[str, ...]] = None,
+                      **filters) -> Union[List[T], List[Dict[str, Any]]]:
+        """Find entities by filters (as dicts of only `fields` when given)"""
         async with self._get_session() as session:
-            stmt = select(self.model_class)
+            stmt = self._select(fields)
             
             # Filter out soft deleted entities unless explicitly requested
             if not include_deleted:
                 stmt = stmt.where(self.model_class.deleted_at.is_(None))
             
-            # Apply filters
-            for key, value in filters.items():
-                if hasattr(self.model_class, key):
-                    column = getattr(self.model_class, key)
-                    stmt = stmt.where(column == value)
-            
-            stmt = stmt.order_by(self.model_class.created_at.desc())
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+            criteria, params = self._filter_criteria(filters)
+            stmt = stmt.where(*criteria).order_by(self.model_class.created_at.desc())
+            result = await session.execute(stmt, params)
+            return self._rows(result, fields)
     
     async def find_one_by(self, **filters) -> Optional[T]:
         """Find one entity by filters"""
@@ -134,54 +181,49 @@ class BaseRepository(Generic[T], ABC):
     
     async def exists_by_id(self, entity_id: Any) -> bool:
         """Check if entity exists by ID"""
-        entity = await self.find_by_id(entity_id)
-        return entity is not None
+        async with self._get_session() as session:
+            # Fetch a constant instead of the whole row
+            stmt = select(literal_column('1')).where(
+                self.model_class.id == entity_id,
+                self.model_class.deleted_at.is_(None)
+            ).limit(1)
+            
+            result = await session.execute(stmt)
+            return result.scalar() is not None
     
     async def exists_by(self, **filters) -> bool:
         """Check if entity exists by filters"""
         async with self._get_session() as session:
-            stmt = select(self.model_class)
-            
-            # Apply filters
-            for key, value in filters.items():
-                if hasattr(self.model_class, key):
-                    column = getattr(self.model_class, key)
-                    stmt = stmt.where(column == value)
-            
-            stmt = stmt.limit(1)
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            criteria, params = self._filter_criteria(filters)
+            stmt = select(literal_column('1')).select_from(self.model_class).where(*criteria).limit(1)
+            result = await session.execute(stmt, params)
+            return result.scalar() is not None
     
     async def count(self, **filters) -> int:
         """Count entities"""
         async with self._get_session() as session:
-            stmt = select(func.count(self.model_class.id))
-            
-            # Apply filters
-            for key, value in filters.items():
-                if hasattr(self.model_class, key):
-                    column = getattr(self.model_class, key)
-                    stmt = stmt.where(column == value)
-            
-            result = await session.execute(stmt)
+            criteria, params = self._filter_criteria(filters)
+            # COUNT(*) skips the per-row NULL check a column argument would need
+            stmt = select(func.count()).select_from(self.model_class).where(*criteria)
+            result = await session.execute(stmt, params)
             return result.scalar_one()
     
     async def delete_by_id(self, entity_id: Any, hard_delete: bool = False) -> bool:
         """Delete entity by ID"""
         async with self._get_session() as session:
-            entity = await session.get(self.model_class, entity_id)
-            if entity:
-                if hard_delete:
-                    # Hard delete - remove from database
-                    await session.delete(entity)
-                else:
-                    # Soft delete - set deleted_at timestamp
-                    entity.soft_delete()
-                    session.add(entity)
-                
-                await session.commit()
-                return True
-            return False
+            if hard_delete:
+                # Hard delete - remove from database
+                stmt = delete(self.model_class).where(self.model_class.id == entity_id)
+            else:
+                # Soft delete - set deleted_at timestamp
+                stmt = update(self.model_class).where(
+                    self.model_class.id == entity_id,
+                    self.model_class.deleted_at.is_(None)
+                ).values(deleted_at=func.now())
+            
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount > 0
     
     async def delete(self, entity: T, hard_delete: bool = False) -> bool:
         """Delete entity"""
@@ -200,15 +242,9 @@ class BaseRepository(Generic[T], ABC):
     async def delete_by(self, **filters) -> int:
         """Delete entities by filters and return count of deleted entities"""
         async with self._get_session() as session:
-            stmt = delete(self.model_class)
-            
-            # Apply filters
-            for key, value in filters.items():
-                if hasattr(self.model_class, key):
-                    column = getattr(self.model_class, key)
-                    stmt = stmt.where(column == value)
-            
-            result = await session.execute(stmt)
+            criteria, params = self._filter_criteria(filters)
+            stmt = delete(self.model_class).where(*criteria).execution_options(synchronize_session=False)
+            result = await session.execute(stmt, params)
             await session.commit()
             return result.rowcount
     
@@ -222,32 +258,30 @@ class BaseRepository(Generic[T], ABC):
     
     async def update_by_id(self, entity_id: Any, **updates) -> Optional[T]:
         """Update entity by ID"""
+        column_names = self.model_class._column_name_set
+        values = {key: value for key, value in updates.items() if key in column_names}
+        if not values:
+            return await self.find_by_id(entity_id, include_deleted=True)
+        
         async with self._get_session() as session:
-            entity = await session.get(self.model_class, entity_id)
-            if entity:
-                for key, value in updates.items():
-                    if hasattr(entity, key):
-                        setattr(entity, key, value)
-                await session.commit()
-                await session.refresh(entity)
-                return entity
-            return None
+            # Single UPDATE ... RETURNING instead of load, mutate and refresh
+            stmt = update(self.model_class).where(
+                self.model_class.id == entity_id
+            ).values(**values).returning(self.model_class)
+            
+            result = await session.execute(stmt)
+            entity = result.scalar_one_or_none()
+            await session.commit()
+            return entity
     
     async def update_by(self, filters: Dict[str, Any], updates: Dict[str, Any]) -> int:
         """Update entities by filters and return count of updated entities"""
         async with self._get_session() as session:
-            stmt = update(self.model_class)
-            
-            # Apply filters
-            for key, value in filters.items():
-                if hasattr(self.model_class, key):
-                    column = getattr(self.model_class, key)
-                    stmt = stmt.where(column == value)
-            
-            # Apply updates
-            stmt = stmt.values(**updates)
-            
-            result = await session.execute(stmt)
+            criteria, params = self._filter_criteria(filters)
+            stmt = update(self.model_class).where(*criteria).values(**updates).execution_options(
+                synchronize_session=False
+            )
+            result = await session.execute(stmt, params)
             await session.commit()
             return result.rowcount
     
@@ -276,13 +310,14 @@ class BaseRepository(Generic[T], ABC):
     async def restore_by_id(self, entity_id: Any) -> bool:
         """Restore a soft deleted entity by ID"""
         async with self._get_session() as session:
-            entity = await session.get(self.model_class, entity_id)
-            if entity and entity.is_deleted():
-                entity.restore()
-                session.add(entity)
-                await session.commit()
-                return True
-            return False
+            stmt = update(self.model_class).where(
+                self.model_class.id == entity_id,
+                self.model_class.deleted_at.is_not(None)
+            ).values(deleted_at=None)
+            
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount > 0
     
     async def find_deleted(self, limit: int = 100, offset: int = 0) -> List[T]:
         """Find only soft deleted entities"""
@@ -297,7 +332,7 @@ class BaseRepository(Generic[T], ABC):
     async def count_deleted(self) -> int:
         """Count soft deleted entities"""
         async with self._get_session() as session:
-            stmt = select(func.count(self.model_class.id)).where(
+            stmt = select(func.count()).select_from(self.model_class).where(
                 self.model_class.deleted_at.is_not(None)
             )
             result = await session.execute(stmt)
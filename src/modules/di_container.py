@@ -1,10 +1,15 @@
+from typing import Any, Dict, Set, Type, TypeVar
 from injector import Injector, singleton
 
+T = TypeVar('T')
+
 
 class GlobalDIContainer:
     
     def __init__(self):
         self.injector = Injector()
+        self._singleton_interfaces: Set[type] = set()
+        self._instances: Dict[type, Any] = {}
         self._configure_global_bindings()
     
     def _configure_global_bindings(self):
@@ -13,9 +18,25 @@ class GlobalDIContainer:
     def register_module_dependencies(self, module_name: str, bindings: list):
         for interface, implementation, scope in bindings:
             self.injector.binder.bind(interface, to=implementation, scope=scope)
+            if scope is singleton:
+                self._singleton_interfaces.add(interface)
+        
+        # Build singletons up front so resolve() is a plain dict lookup at request time
+        for interface, _, scope in bindings:
+            if scope is singleton:
+                self._instances[interface] = self.injector.get(interface)
+    
+    def resolve(self, interface: Type[T]) -> T:
+        """Resolve a dependency; singletons go through the injector only on first lookup"""
+        instance = self._instances.get(interface)
+        if instance is None:
+            instance = self.injector.get(interface)
+            if interface in self._singleton_interfaces:
+                self._instances[interface] = instance
+        return instance
     
     def get_injector(self):
         return self.injector
 
 
-global_di_container = GlobalDIContainer() 
\ No newline at end of file
+global_di_container = GlobalDIContainer() 
@@ -1,16 +1,40 @@
-from datetime import datetime
-from fastapi import APIRouter, status
+import time
+import orjson
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Response, status
 
 from ..models.health_models import HealthResponse
 from api.core.config import settings
 
+# Health responses are reused for this long to absorb high-frequency warmer pings
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
 
 class HealthController:
     
     def __init__(self):
         self.router = APIRouter()
+        # Everything but the timestamp is fixed for the lifetime of the process
+        self._static_fields = {
+            "version": settings.app_version,
+            "environment": settings.environment,
+            "service": settings.app_name,
+        }
+        self._cached_body: Optional[bytes] = None
+        self._cached_expiry = 0.0
         self._register_routes()
     
+    def _get_health_body(self) -> bytes:
+        now = time.monotonic()
+        if self._cached_body is None or now >= self._cached_expiry:
+            self._cached_body = orjson.dumps(
+                {"status": "healthy", "timestamp": datetime.now(timezone.utc), **self._static_fields},
+                option=orjson.OPT_UTC_Z,
+            )
+            self._cached_expiry = now + HEALTH_CACHE_TTL_SECONDS
+        return self._cached_body
+    
     def _register_routes(self):
         @self.router.get(
             "/health",
@@ -19,11 +43,17 @@ class HealthController:
             summary="Health Check",
             description="Check if the service is running and healthy"
         )
-        async def health_check() -> HealthResponse:
-            return HealthResponse(
-                status="healthy",
-                timestamp=datetime.utcnow(),
-                version=settings.app_version,
-                environment=settings.environment,
-                service=settings.app_name,
-            )
\ No newline at end of file
+        async def health_check() -> Response:
+            # Pre-serialized body: no pydantic model construction or validation per hit
+            return Response(content=self._get_health_body(), media_type="application/json")
+        
+        if settings.expose_pool_status:
+            @self.router.get(
+                "/debug/pool",
+                status_code=status.HTTP_200_OK,
+                summary="Connection Pool Status",
+                description="Report database connection pool usage (opt-in via EXPOSE_POOL_STATUS)"
+            )
+            async def pool_status() -> dict:
+                from ...database import db_connection
+                return {"pool": db_connection.pool_status()}
@@ -24,7 +24,7 @@ class HealthModule:
     def _register_routes(self):
         from ..di_container import global_di_container
         from .controllers.health_controller import HealthController
-        health_controller = global_di_container.get_injector().get(HealthController)
+        health_controller = global_di_container.resolve(HealthController)
         self.router.include_router(health_controller.router)
 
 
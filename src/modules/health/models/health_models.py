@@ -1,8 +1,10 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     status: str
     timestamp: datetime
     version: str
@@ -11,5 +13,7 @@ class HealthResponse(BaseModel):
 
 
 class MessageResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     message: str
-    timestamp: datetime 
\ No newline at end of file
+    timestamp: datetime
\ No newline at end of file
@@ -1,10 +1,13 @@
 from datetime import datetime, date
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+from api.core.types import EmailAddress
 
 
 class CreateUserRequest(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     username: Optional[str] = Field(None, min_length=3, max_length=50)
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
     paternal_surname: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -18,7 +21,7 @@ class CreateUserRequest(BaseModel):
 
 
 class UpdateUserRequest(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[EmailAddress] = None
     username: Optional[str] = Field(None, min_length=3, max_length=50)
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
     paternal_surname: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -40,7 +43,7 @@ class UpdateProfileRequest(BaseModel):
 
 
 class UpdateContactRequest(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[EmailAddress] = None
     phone: Optional[str] = Field(None, max_length=20)
 
 
@@ -49,7 +52,7 @@ class SetPasswordRequest(BaseModel):
 
 
 class UpdateUserWithPasswordRequest(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[EmailAddress] = None
     username: Optional[str] = Field(None, min_length=3, max_length=50)
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
     paternal_surname: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -63,7 +66,9 @@ class UpdateUserWithPasswordRequest(BaseModel):
 
 
 class UpdateUserResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    id: UUID
     email: str
     username: Optional[str] = None
     first_name: Optional[str] = None
@@ -82,7 +87,9 @@ class UpdateUserResponse(BaseModel):
 
 
 class UserResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    id: UUID
     email: str
     username: Optional[str] = None
     first_name: Optional[str] = None
@@ -104,4 +111,4 @@ class UsersListResponse(BaseModel):
     users: List[UserResponse]
     total: int
     skip: int
-    limit: int 
\ No newline at end of file
+    limit: int
@@ -1,11 +1,17 @@
 from datetime import datetime, date
-from typing import Optional
-from sqlalchemy import Column, String, Boolean, Date
+from typing import Any, Optional, Tuple
+from sqlalchemy import Column, String, Boolean, Date, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import UUID
 
 from ...database.model import BaseModel
 
 
+# Fields accepted by update_profile / update_contact_info, in argument order
+_PROFILE_FIELDS = ('first_name', 'paternal_surname', 'maternal_surname', 'phone', 'date_of_birth', 'gender')
+_CONTACT_FIELDS = ('email', 'phone')
+
+
 class User(BaseModel):
     """User entity following PostgreSQL DDL schema"""
     
@@ -50,10 +56,22 @@ class User(BaseModel):
         self.password_hash = password_hash
         self.enabled = enabled
     
+    @hybrid_property
+    def full_name(self) -> str:
+        """User's full name; in queries it is built by Postgres during the scan"""
+        names = (self.first_name, self.paternal_surname, self.maternal_surname)
+        return ' '.join(name for name in names if name)
+    
+    @full_name.inplace.expression
+    @classmethod
+    def _full_name_expression(cls):
+        # concat_ws only skips NULLs; NULLIF also drops empty parts, as the Python side does
+        names = (cls.first_name, cls.paternal_surname, cls.maternal_surname)
+        return func.concat_ws(' ', *(func.nullif(name, '') for name in names))
+    
     def get_full_name(self) -> str:
         """Get user's full name"""
-        names = [self.first_name, self.paternal_surname, self.maternal_surname]
-        return ' '.join(name for name in names if name)
+        return self.full_name
     
     def enable(self) -> None:
         """Enable user account"""
@@ -69,26 +87,18 @@ class User(BaseModel):
                       maternal_surname: Optional[str] = None, phone: Optional[str] = None,
                       date_of_birth: Optional[date] = None, gender: Optional[str] = None) -> None:
         """Update user profile information"""
-        if first_name is not None:
-            self.first_name = first_name
-        if paternal_surname is not None:
-            self.paternal_surname = paternal_surname
-        if maternal_surname is not None:
-            self.maternal_surname = maternal_surname
-        if phone is not None:
-            self.phone = phone
-        if date_of_birth is not None:
-            self.date_of_birth = date_of_birth
-        if gender is not None:
-            self.gender = gender
-        self.update_fields()
+        self._set_provided(_PROFILE_FIELDS, (first_name, paternal_surname, maternal_surname,
+                                             phone, date_of_birth, gender))
     
     def update_contact_info(self, email: Optional[str] = None, phone: Optional[str] = None) -> None:
         """Update contact information"""
-        if email is not None:
-            self.email = email
-        if phone is not None:
-            self.phone = phone
+        self._set_provided(_CONTACT_FIELDS, (email, phone))
+    
+    def _set_provided(self, fields: Tuple[str, ...], values: Tuple[Any, ...]) -> None:
+        """Assign each value that is not None to its field"""
+        for field, value in zip(fields, values):
+            if value is not None:
+                setattr(self, field, value)
         self.update_fields()
     
     def set_password(self, password_hash: str) -> None:
@@ -1,5 +1,7 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Set
 from injector import inject
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.sql.base import ExecutableOption
 
 from ...database.repository import BaseRepository
 from ..models.user import User
@@ -21,6 +23,34 @@ class UserRepository(BaseRepository[User]):
         """Check if user exists by email"""
         return await self.exists_by(email=email)
     
+    async def update_returning(self, user_id: Any, **updates) -> Optional[User]:
+        """Apply a partial update to a live user with a single UPDATE ... RETURNING"""
+        if not updates:
+            return await self.find_by_id(user_id)
+        
+        async with self._get_session() as session:
+            stmt = update(User).where(
+                User.id == user_id,
+                User.deleted_at.is_(None)
+            ).values(**updates).returning(User)
+            
+            user = (await session.execute(stmt)).scalar_one_or_none()
+            await session.commit()
+            return user
+    
+    async def find_conflicting_fields(self, email: str, username: Optional[str] = None,
+                                      national_id: Optional[str] = None) -> Set[str]:
+        """Return which of the given unique fields are already taken, in one query"""
+        candidates = {'email': email, 'username': username, 'national_id': national_id}
+        checks = [(name, getattr(User, name) == value) for name, value in candidates.items() if value]
+        
+        async with self._get_session() as session:
+            stmt = select(*(func.bool_or(condition).label(name) for name, condition in checks)).where(
+                or_(*(condition for _, condition in checks))
+            )
+            row = (await session.execute(stmt)).mappings().one()
+            return {name for name, taken in row.items() if taken}
+    
     async def exists_by_username(self, username: str) -> bool:
         """Check if user exists by username"""
         return await self.exists_by(username=username)
@@ -29,6 +59,8 @@ class UserRepository(BaseRepository[User]):
         """Check if user exists by national ID"""
         return await self.exists_by(national_id=national_id)
     
-    async def get_users_paginated(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_users_paginated(self, skip: int = 0, limit: int = 100,
+                                  options: Optional[Sequence[ExecutableOption]] = None) -> List[User]:
         """Get users with pagination (alias for find_all)"""
-        return await self.find_all(limit=limit, offset=skip)
\ No newline at end of file
+        # User has no relationships yet; add their selectinload() here when it does
+        return await self.find_all(limit=limit, offset=skip, options=options)
@@ -1,9 +1,33 @@
-from passlib.context import CryptContext
+import asyncio
+import os
+import secrets
+import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from injector import inject
 from ..password_service import PasswordService
 
-# Configure password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id (releases the GIL while hashing); existing bcrypt
+# hashes keep verifying. Cost parameters can track the hardware via env.
+_password_hasher = PasswordHasher(
+    time_cost=int(os.getenv('ARGON2_TIME_COST', '3')),
+    memory_cost=int(os.getenv('ARGON2_MEMORY_COST', '65536')),
+    parallelism=int(os.getenv('ARGON2_PARALLELISM', '4')),
+)
+
+# Hashing is CPU-bound: it runs on a pool sized to the CPU count, off the event
+# loop, which also caps how many hashes a burst of requests can run at once
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+ARGON2_PREFIX = "$argon2"
+BCRYPT_PREFIX = "$2"
+
+# Hash of a discarded random secret, made with the default argon2 parameters above;
+# shipped precomputed so startup does not spend a full hash on it
+_DEFAULT_DUMMY_HASH = (
+    "$argon2id$v=19$m=65536,t=3,p=4$LPv2QZS0OXKzTQQNRK3IIw$97kuaksVvMwWiiDt0JeIakfTmJB76GtrPAHnAzKAQsY"
+)
 
 
 class PasswordServiceImpl(PasswordService):
@@ -11,12 +35,48 @@ class PasswordServiceImpl(PasswordService):
     
     @inject
     def __init__(self):
-        pass
+        # Only env-tuned costs need a fresh dummy, so it verifies as slowly as real hashes
+        self._dummy_hash = _DEFAULT_DUMMY_HASH
+        if _password_hasher.check_needs_rehash(_DEFAULT_DUMMY_HASH):
+            self._dummy_hash = _password_hasher.hash(secrets.token_hex(16))
     
-    def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
-        return pwd_context.hash(password)
+    @property
+    def dummy_hash(self) -> str:
+        """A throwaway hash made with the current scheme and cost"""
+        return self._dummy_hash
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def hash_password(self, password: str) -> str:
+        """Hash a password using argon2id"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HASH_EXECUTOR, _password_hasher.hash, password)
+    
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HASH_EXECUTOR, self._verify, plain_password, hashed_password)
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with an outdated scheme or cost"""
+        if not hashed_password.startswith(ARGON2_PREFIX):
+            return True
+        try:
+            return _password_hasher.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+    
+    @staticmethod
+    def _verify(plain_password: str, hashed_password: str) -> bool:
+        if hashed_password.startswith(ARGON2_PREFIX):
+            try:
+                return _password_hasher.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        
+        if hashed_password.startswith(BCRYPT_PREFIX):
+            try:
+                return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+            except ValueError:
+                return False
+        
+        # Unknown hash format
+        return False
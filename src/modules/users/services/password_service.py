@@ -5,11 +5,22 @@ class PasswordService(ABC):
     """Interface for password hashing and verification"""
     
     @abstractmethod
-    def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
+    async def hash_password(self, password: str) -> str:
+        """Hash a password"""
         pass
     
     @abstractmethod
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
         pass
+    
+    @property
+    @abstractmethod
+    def dummy_hash(self) -> str:
+        """A throwaway hash made with the current scheme and cost"""
+        pass
+    
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with an outdated scheme or cost"""
+        pass
@@ -17,4 +17,8 @@ class UserService(ABC):
     
     @abstractmethod
     async def update_user_with_password(self, user_id: str, request: UpdateUserWithPasswordRequest) -> UpdateUserResponse:
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        pass
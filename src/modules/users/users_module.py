@@ -33,7 +33,7 @@ class UsersModule:
         from ..di_container import global_di_container
         from .controllers.user_controller import UserController
 
-        user_controller = global_di_container.get_injector().get(UserController)
+        user_controller = global_di_container.resolve(UserController)
         self.router.include_router(user_controller.router)
 
 